@@ -27,6 +27,7 @@ from cirq.google.api.v1.programs import (
     is_native_xmon_op,
     pack_results,
     circuit_as_schedule_to_protos,
+    circuit_as_schedule_to_program,
     circuit_from_schedule_from_protos,
     unpack_results,
     xmon_op_from_proto,
@@ -12,13 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import json
-from typing import (Any, cast, Dict, Iterable, Optional, Sequence, Tuple,
-                    TYPE_CHECKING, Iterator)
+from typing import (Any, Callable, cast, Dict, Iterable, Optional, Sequence,
+                    Tuple, TYPE_CHECKING, Iterator)
 import numpy as np
 import sympy
 
 from cirq import devices, ops, protocols, value, circuits
-from cirq.google.api.v1 import operations_pb2
+from cirq.google.api.v1 import operations_pb2, program_pb2
 
 if TYPE_CHECKING:
     import cirq
@@ -31,94 +31,103 @@ def _load_json_bool(b: Any):
     return json.loads(b)
 
 
-def gate_to_proto(gate: 'cirq.Gate', qubits: Tuple['cirq.Qid', ...],
-                  delay: int) -> operations_pb2.Operation:
-    if isinstance(gate, ops.MeasurementGate):
-        return operations_pb2.Operation(incremental_delay_picoseconds=delay,
-                                        measurement=_measure_to_proto(
-                                            gate, qubits))
-
-    if isinstance(gate, ops.XPowGate):
-        if len(qubits) != 1:
-            # coverage: ignore
-            raise ValueError('Wrong number of qubits.')
-        return operations_pb2.Operation(incremental_delay_picoseconds=delay,
-                                        exp_w=_x_to_proto(gate, qubits[0]))
-
-    if isinstance(gate, ops.YPowGate):
-        if len(qubits) != 1:
-            # coverage: ignore
-            raise ValueError('Wrong number of qubits.')
-        return operations_pb2.Operation(incremental_delay_picoseconds=delay,
-                                        exp_w=_y_to_proto(gate, qubits[0]))
-
-    if isinstance(gate, ops.PhasedXPowGate):
-        if len(qubits) != 1:
-            # coverage: ignore
-            raise ValueError('Wrong number of qubits.')
-        return operations_pb2.Operation(incremental_delay_picoseconds=delay,
-                                        exp_w=_phased_x_to_proto(
-                                            gate, qubits[0]))
-
-    if isinstance(gate, ops.ZPowGate):
-        if len(qubits) != 1:
-            # coverage: ignore
-            raise ValueError('Wrong number of qubits.')
-        return operations_pb2.Operation(incremental_delay_picoseconds=delay,
-                                        exp_z=_z_to_proto(gate, qubits[0]))
-
-    if isinstance(gate, ops.CZPowGate):
-        if len(qubits) != 2:
-            # coverage: ignore
-            raise ValueError('Wrong number of qubits.')
-        return operations_pb2.Operation(incremental_delay_picoseconds=delay,
-                                        exp_11=_cz_to_proto(gate, *qubits))
-
-    raise ValueError("Don't know how to serialize this gate: {!r}".format(gate))
-
-
-def _x_to_proto(gate: 'cirq.XPowGate', q: 'cirq.Qid') -> operations_pb2.ExpW:
-    return operations_pb2.ExpW(target=_qubit_to_proto(q),
-                               axis_half_turns=_parameterized_value_to_proto(0),
-                               half_turns=_parameterized_value_to_proto(
-                                   gate.exponent))
-
-
-def _y_to_proto(gate: 'cirq.YPowGate', q: 'cirq.Qid') -> operations_pb2.ExpW:
-    return operations_pb2.ExpW(
-        target=_qubit_to_proto(q),
-        axis_half_turns=_parameterized_value_to_proto(0.5),
-        half_turns=_parameterized_value_to_proto(gate.exponent))
+def gate_to_proto(gate: 'cirq.Gate',
+                  qubits: Tuple['cirq.Qid', ...],
+                  delay: int,
+                  out: Optional[operations_pb2.Operation] = None
+                 ) -> operations_pb2.Operation:
+    """Serializes a gate applied to some qubits into an Operation proto.
+
+    Args:
+        gate: The gate to serialize. Must be a native xmon gate.
+        qubits: The grid qubits the gate is applied to.
+        delay: The delay, in picoseconds, relative to the previous operation.
+        out: An existing Operation message to fill in, e.g. one returned by
+            `program.operations.add()`. Any previous contents are cleared.
+            If not specified, a new message is created.
+
+    Returns:
+        The populated Operation proto (`out` when it was given).
+
+    Raises:
+        ValueError: The gate can't be serialized on the given qubits.
+    """
+    if out is None:
+        out = operations_pb2.Operation()
+    else:
+        out.Clear()
+    out.incremental_delay_picoseconds = delay
+
+    writer = _GATE_WRITERS.get(type(gate))
+    if writer is None:
+        # Not an exact match; fall back to subclass checks, in table order.
+        for gate_type, candidate in _GATE_WRITERS.items():
+            if isinstance(gate, gate_type):
+                writer = candidate
+                break
+        else:
+            raise ValueError(
+                "Don't know how to serialize this gate: {!r}".format(gate))
+    writer(gate, qubits, out)
+    return out
+
+
+def _single_qubit(qubits: Sequence['cirq.Qid']) -> 'cirq.Qid':
+    if len(qubits) != 1:
+        raise ValueError('Wrong number of qubits.')
+    return qubits[0]
+
+
+def _x_to_proto(gate: 'cirq.XPowGate', qubits: Sequence['cirq.Qid'],
+                out: operations_pb2.Operation) -> None:
+    exp_w = out.exp_w
+    _qubit_to_proto(_single_qubit(qubits), exp_w.target)
+    _parameterized_value_to_proto(0, exp_w.axis_half_turns)
+    _parameterized_value_to_proto(gate.exponent, exp_w.half_turns)
+
+
+def _y_to_proto(gate: 'cirq.YPowGate', qubits: Sequence['cirq.Qid'],
+                out: operations_pb2.Operation) -> None:
+    exp_w = out.exp_w
+    _qubit_to_proto(_single_qubit(qubits), exp_w.target)
+    _parameterized_value_to_proto(0.5, exp_w.axis_half_turns)
+    _parameterized_value_to_proto(gate.exponent, exp_w.half_turns)
 
 
 def _phased_x_to_proto(gate: 'cirq.PhasedXPowGate',
-                       q: 'cirq.Qid') -> operations_pb2.ExpW:
-    return operations_pb2.ExpW(
-        target=_qubit_to_proto(q),
-        axis_half_turns=_parameterized_value_to_proto(gate.phase_exponent),
-        half_turns=_parameterized_value_to_proto(gate.exponent))
+                       qubits: Sequence['cirq.Qid'],
+                       out: operations_pb2.Operation) -> None:
+    exp_w = out.exp_w
+    _qubit_to_proto(_single_qubit(qubits), exp_w.target)
+    _parameterized_value_to_proto(gate.phase_exponent, exp_w.axis_half_turns)
+    _parameterized_value_to_proto(gate.exponent, exp_w.half_turns)
 
 
-def _z_to_proto(gate: 'cirq.ZPowGate', q: 'cirq.Qid') -> operations_pb2.ExpZ:
-    return operations_pb2.ExpZ(target=_qubit_to_proto(q),
-                               half_turns=_parameterized_value_to_proto(
-                                   gate.exponent))
+def _z_to_proto(gate: 'cirq.ZPowGate', qubits: Sequence['cirq.Qid'],
+                out: operations_pb2.Operation) -> None:
+    exp_z = out.exp_z
+    _qubit_to_proto(_single_qubit(qubits), exp_z.target)
+    _parameterized_value_to_proto(gate.exponent, exp_z.half_turns)
 
 
-def _cz_to_proto(gate: 'cirq.CZPowGate', p: 'cirq.Qid',
-                 q: 'cirq.Qid') -> operations_pb2.Exp11:
-    return operations_pb2.Exp11(target1=_qubit_to_proto(p),
-                                target2=_qubit_to_proto(q),
-                                half_turns=_parameterized_value_to_proto(
-                                    gate.exponent))
+def _cz_to_proto(gate: 'cirq.CZPowGate', qubits: Sequence['cirq.Qid'],
+                 out: operations_pb2.Operation) -> None:
+    if len(qubits) != 2:
+        raise ValueError('Wrong number of qubits.')
+    exp_11 = out.exp_11
+    _qubit_to_proto(qubits[0], exp_11.target1)
+    _qubit_to_proto(qubits[1], exp_11.target2)
+    _parameterized_value_to_proto(gate.exponent, exp_11.half_turns)
 
 
-def _qubit_to_proto(qubit):
-    return operations_pb2.Qubit(row=qubit.row, col=qubit.col)
+def _qubit_to_proto(qubit, out: operations_pb2.Qubit) -> None:
+    out.row = qubit.row
+    out.col = qubit.col
 
 
 def _measure_to_proto(gate: 'cirq.MeasurementGate',
-                      qubits: Sequence['cirq.Qid']):
+                      qubits: Sequence['cirq.Qid'],
+                      out: operations_pb2.Operation) -> None:
     if len(qubits) == 0:
         raise ValueError('Measurement gate on no qubits.')
 
@@ -130,10 +139,24 @@ def _measure_to_proto(gate: 'cirq.MeasurementGate',
     if invert_mask and len(invert_mask) != len(qubits):
         raise ValueError('Measurement gate had invert mask of length '
                          'different than number of qubits it acts on.')
-    return operations_pb2.Measurement(
-        targets=[_qubit_to_proto(q) for q in qubits],
-        key=protocols.measurement_key(gate),
-        invert_mask=invert_mask)
+    measurement = out.measurement
+    for q in qubits:
+        _qubit_to_proto(q, measurement.targets.add())
+    measurement.key = protocols.measurement_key(gate)
+    if invert_mask:
+        measurement.invert_mask.extend(invert_mask)
+
+
+# Serializers for each native xmon gate type, which write into an Operation.
+# Looked up by exact type first; subclasses are matched in this order.
+_GATE_WRITERS: Dict[type, Callable[..., None]] = {
+    ops.MeasurementGate: _measure_to_proto,
+    ops.XPowGate: _x_to_proto,
+    ops.YPowGate: _y_to_proto,
+    ops.PhasedXPowGate: _phased_x_to_proto,
+    ops.ZPowGate: _z_to_proto,
+    ops.CZPowGate: _cz_to_proto,
+}
 
 
 def circuit_as_schedule_to_protos(circuit: 'cirq.Circuit'
@@ -147,6 +170,38 @@ def circuit_as_schedule_to_protos(circuit: 'cirq.Circuit'
     Yields:
         An Operation proto.
     """
+    for op, delay in _schedule_delays(circuit):
+        yield gate_to_proto(cast(ops.Gate, op.gate), op.qubits, delay)
+
+
+def circuit_as_schedule_to_program(circuit: 'cirq.Circuit'
+                                  ) -> program_pb2.Program:
+    """Convert a circuit into a Program proto.
+
+    Equivalent to packing the result of `circuit_as_schedule_to_protos` into
+    a Program, but each operation is written directly into the program's
+    repeated field instead of being built separately and then copied.
+
+    Args:
+        circuit: The circuit to convert to a proto. Must contain only
+            gates that can be cast to xmon gates.
+
+    Returns:
+        A Program proto whose operations are those of the circuit.
+    """
+    program = program_pb2.Program()
+    add_operation = program.operations.add
+    for op, delay in _schedule_delays(circuit):
+        gate_to_proto(cast(ops.Gate, op.gate),
+                      op.qubits,
+                      delay,
+                      out=add_operation())
+    return program
+
+
+def _schedule_delays(circuit: 'cirq.Circuit'
+                    ) -> Iterator[Tuple['cirq.Operation', int]]:
+    """Yields each operation of the circuit with its delay in picoseconds."""
     last_picos: Optional[int] = None
     time_picos = 0
     for op in circuit.all_operations():
@@ -154,10 +209,9 @@ def circuit_as_schedule_to_protos(circuit: 'cirq.Circuit'
             delay = time_picos
         else:
             delay = time_picos - last_picos
-        op_proto = gate_to_proto(cast(ops.Gate, op.gate), op.qubits, delay)
+        yield op, delay
         time_picos += 1
         last_picos = time_picos
-        yield op_proto
 
 
 def circuit_from_schedule_from_protos(
@@ -283,30 +337,51 @@ def xmon_op_from_proto(proto: operations_pb2.Operation) -> 'cirq.Operation':
     Returns:
         The operation.
     """
+    decoder = _OP_DECODERS.get(proto.WhichOneof('operation'))
+    if decoder is None:
+        raise ValueError('invalid operation: {}'.format(proto))
+    return decoder(proto)
+
+
+def _exp_w_from_proto(proto: operations_pb2.Operation) -> 'cirq.Operation':
     param = _parameterized_value_from_proto
+    exp_w = proto.exp_w
+    return ops.PhasedXPowGate(
+        exponent=param(exp_w.half_turns),
+        phase_exponent=param(exp_w.axis_half_turns),
+    ).on(_qubit_from_proto(exp_w.target))
+
+
+def _exp_z_from_proto(proto: operations_pb2.Operation) -> 'cirq.Operation':
+    exp_z = proto.exp_z
+    half_turns = _parameterized_value_from_proto(exp_z.half_turns)
+    return ops.Z(_qubit_from_proto(exp_z.target))**half_turns
+
+
+def _exp_11_from_proto(proto: operations_pb2.Operation) -> 'cirq.Operation':
+    qubit = _qubit_from_proto
+    exp_11 = proto.exp_11
+    half_turns = _parameterized_value_from_proto(exp_11.half_turns)
+    return ops.CZ(qubit(exp_11.target1), qubit(exp_11.target2))**half_turns
+
+
+def _measurement_from_proto(proto: operations_pb2.Operation
+                           ) -> 'cirq.Operation':
     qubit = _qubit_from_proto
-    if proto.HasField('exp_w'):
-        exp_w = proto.exp_w
-        return ops.PhasedXPowGate(
-            exponent=param(exp_w.half_turns),
-            phase_exponent=param(exp_w.axis_half_turns),
-        ).on(qubit(exp_w.target))
-    if proto.HasField('exp_z'):
-        exp_z = proto.exp_z
-        return ops.Z(qubit(exp_z.target))**param(exp_z.half_turns)
-    if proto.HasField('exp_11'):
-        exp_11 = proto.exp_11
-        return ops.CZ(qubit(exp_11.target1),
-                      qubit(exp_11.target2))**param(exp_11.half_turns)
-    if proto.HasField('measurement'):
-        meas = proto.measurement
-        return ops.MeasurementGate(
-            num_qubits=len(meas.targets),
-            key=meas.key,
-            invert_mask=tuple(
-                meas.invert_mask)).on(*[qubit(q) for q in meas.targets])
-
-    raise ValueError('invalid operation: {}'.format(proto))
+    meas = proto.measurement
+    gate = ops.MeasurementGate(num_qubits=len(meas.targets),
+                               key=meas.key,
+                               invert_mask=tuple(meas.invert_mask))
+    return gate.on(*[qubit(q) for q in meas.targets])
+
+
+# Decoders keyed by the name of the field set in the `operation` oneof.
+_OP_DECODERS: Dict[Optional[str], Callable[..., 'cirq.Operation']] = {
+    'exp_w': _exp_w_from_proto,
+    'exp_z': _exp_z_from_proto,
+    'exp_11': _exp_11_from_proto,
+    'measurement': _measurement_from_proto,
+}
 
 
 def _qubit_from_proto(proto: operations_pb2.Qubit):
@@ -315,8 +390,11 @@ def _qubit_from_proto(proto: operations_pb2.Qubit):
 
 def _parameterized_value_from_proto(proto: operations_pb2.ParameterizedFloat
                                    ) -> value.TParamVal:
-    if proto.HasField('parameter_key'):
-        return sympy.Symbol(proto.parameter_key)
+    # parameter_key is never empty when set, so a truthy read doubles as the
+    # presence check.
+    key = proto.parameter_key
+    if key:
+        return sympy.Symbol(key)
     if proto.HasField('raw'):
         return proto.raw
     raise ValueError('No value specified for parameterized float. '
@@ -324,10 +402,37 @@ def _parameterized_value_from_proto(proto: operations_pb2.ParameterizedFloat
                      'proto: {!r}'.format(proto))
 
 
-def _parameterized_value_to_proto(param: value.TParamVal
-                                 ) -> operations_pb2.ParameterizedFloat:
+def _parameterized_value_to_proto(
+        param: value.TParamVal,
+        out: Optional[operations_pb2.ParameterizedFloat] = None
+) -> operations_pb2.ParameterizedFloat:
+    if out is None:
+        out = operations_pb2.ParameterizedFloat()
+    _PARAM_WRITERS.get(type(param), _write_param)(param, out)
+    return out
+
+
+def _write_parameter_key(param: sympy.Symbol,
+                         out: operations_pb2.ParameterizedFloat) -> None:
+    out.parameter_key = param.name
+
+
+def _write_raw(param: float, out: operations_pb2.ParameterizedFloat) -> None:
+    out.raw = float(param)
+
+
+def _write_param(param: value.TParamVal,
+                 out: operations_pb2.ParameterizedFloat) -> None:
+    # Fallback for Symbol subclasses and numpy scalars.
     if isinstance(param, sympy.Symbol):
-        return operations_pb2.ParameterizedFloat(
-            parameter_key=str(param.free_symbols.pop()))
+        _write_parameter_key(param, out)
     else:
-        return operations_pb2.ParameterizedFloat(raw=float(param))
+        _write_raw(cast(float, param), out)
+
+
+# Writers for the exact parameter types seen in practice.
+_PARAM_WRITERS: Dict[type, Callable[..., None]] = {
+    sympy.Symbol: _write_parameter_key,
+    float: _write_raw,
+    int: _write_raw,
+}
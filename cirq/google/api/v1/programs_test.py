@@ -19,8 +19,9 @@ import sympy
 import cirq
 import cirq.google as cg
 import cirq.google.api.v1.programs as programs
-from cirq.google.api.v1 import operations_pb2
-from cirq.google.api.v1.programs import (_parameterized_value_from_proto)
+from cirq.google.api.v1 import operations_pb2, program_pb2
+from cirq.google.api.v1.programs import (_parameterized_value_from_proto,
+                                         _parameterized_value_to_proto)
 
 
 def assert_proto_dict_convert(gate: cirq.Gate, proto: operations_pb2.Operation,
@@ -43,6 +44,21 @@ def test_protobuf_round_trip():
     assert s2 == circuit
 
 
+def test_circuit_as_schedule_to_program():
+    device = cg.Foxtail
+    q = cirq.GridQubit(0, 0)
+    circuit = cirq.Circuit(cirq.X(q)**0.5,
+                           cirq.Z(q)**0.25,
+                           cirq.measure(q, key='m'),
+                           device=device)
+
+    program = programs.circuit_as_schedule_to_program(circuit)
+    assert program == program_pb2.Program(
+        operations=list(programs.circuit_as_schedule_to_protos(circuit)))
+    assert programs.circuit_from_schedule_from_protos(
+        device, program.operations) == circuit
+
+
 def make_bytes(s: str) -> bytes:
     """Helper function to convert a string of digits into packed bytes.
 
@@ -275,6 +291,35 @@ def test_w_to_proto():
     assert_proto_dict_convert(gate, proto, cirq.GridQubit(2, 3))
 
 
+def test_gate_to_proto_into_existing_message():
+    program = program_pb2.Program()
+    a = cirq.GridQubit(2, 3)
+    b = cirq.GridQubit(3, 4)
+    out = program.operations.add()
+    result = programs.gate_to_proto(cirq.CZ**0.5, (a, b), delay=7, out=out)
+    assert result is out
+    expected = programs.gate_to_proto(cirq.CZ**0.5, (a, b), delay=7)
+    assert program.operations[0] == expected
+
+    # Reusing a message clears whatever was in it before.
+    programs.gate_to_proto(cirq.MeasurementGate(1, 'm'), (a,), delay=0, out=out)
+    assert out == operations_pb2.Operation(
+        measurement=operations_pb2.Measurement(
+            targets=[operations_pb2.Qubit(row=2, col=3)], key='m'))
+
+
+def test_pauli_gates_serialize_like_pow_gates():
+    # cirq.X/Y/Z are subclasses of the pow gates, so they go through the
+    # isinstance fallback rather than an exact type match.
+    q = cirq.GridQubit(2, 3)
+    for pauli, pow_gate in [(cirq.X, cirq.XPowGate()),
+                            (cirq.Y, cirq.YPowGate()),
+                            (cirq.Z, cirq.ZPowGate())]:
+        assert type(pauli) is not type(pow_gate)
+        expected = programs.gate_to_proto(pow_gate, (q,), delay=0)
+        assert programs.gate_to_proto(pauli, (q,), delay=0) == expected
+
+
 def test_unsupported_op():
     with pytest.raises(ValueError, match='invalid operation'):
         programs.xmon_op_from_proto(operations_pb2.Operation())
@@ -313,6 +358,20 @@ def test_parameterized_value_from_proto():
     assert from_proto(m3) == sympy.Symbol('rr')
 
 
+def test_parameterized_value_to_proto():
+    to_proto = _parameterized_value_to_proto
+
+    assert to_proto(5) == operations_pb2.ParameterizedFloat(raw=5)
+    assert to_proto(0.5) == operations_pb2.ParameterizedFloat(raw=0.5)
+    assert to_proto(np.float32(0.5)).raw == 0.5
+    assert to_proto(sympy.Symbol('rr')) == operations_pb2.ParameterizedFloat(
+        parameter_key='rr')
+
+    out = operations_pb2.ParameterizedFloat(parameter_key='old')
+    assert to_proto(0.25, out) is out
+    assert out == operations_pb2.ParameterizedFloat(raw=0.25)
+
+
 def test_invalid_measurement_gate():
     with pytest.raises(ValueError, match='length'):
         _ = programs.gate_to_proto(cirq.MeasurementGate(3,
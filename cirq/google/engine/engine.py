@@ -329,10 +329,7 @@ class Engine:
         program.device.validate_circuit(program)
 
         if self.context.proto_version == ProtoVersion.V1:
-            code.Pack(
-                v1.program_pb2.Program(operations=[
-                    op for op in v1.circuit_as_schedule_to_protos(program)
-                ]))
+            code.Pack(v1.circuit_as_schedule_to_program(program))
         elif self.context.proto_version == ProtoVersion.V2:
             program = gate_set.serialize(program)
             code.Pack(program)
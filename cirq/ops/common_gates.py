@@ -24,7 +24,8 @@ This module creates Gate instances for the following gates:
 Each of these are implemented as EigenGates, which means that they can be
 raised to a power (i.e. cirq.H**0.5). See the definition in EigenGate.
 """
-from typing import Any, cast, Collection, Optional, Sequence, Tuple, Union
+from typing import (Any, cast, Collection, Dict, Optional, Sequence, Tuple,
+                    Union)
 
 import numpy as np
 import sympy
@@ -46,6 +47,29 @@ imports.
 """
 
 
+def _read_only(matrix: np.ndarray) -> np.ndarray:
+    matrix.setflags(write=False)
+    return matrix
+
+
+_Z_UNITARY = _read_only(np.diag([1, -1]).astype(np.complex128))
+_CZ_UNITARY = _read_only(np.diag([1, 1, 1, -1]).astype(np.complex128))
+
+# Exact unitaries of common phase gates, keyed by exponent (global_shift=0).
+_STATIC_Z_UNITARIES: Dict[float, np.ndarray] = {
+    1: _Z_UNITARY,
+    -1: _Z_UNITARY,
+    0.5: _read_only(np.diag([1, 1j]).astype(np.complex128)),
+    -0.5: _read_only(np.diag([1, -1j]).astype(np.complex128)),
+    0.25: _read_only(np.diag([1, (1 + 1j) * np.sqrt(0.5)])),
+    -0.25: _read_only(np.diag([1, (1 - 1j) * np.sqrt(0.5)])),
+}
+_STATIC_CZ_UNITARIES: Dict[float, np.ndarray] = {
+    1: _CZ_UNITARY,
+    -1: _CZ_UNITARY,
+}
+
+
 @value.value_equality
 class XPowGate(eigen_gate.EigenGate,
                gate_features.SingleQubitGate):
@@ -204,29 +228,26 @@ class XPowGate(eigen_gate.EigenGate,
         if self._global_shift == -0.5:
             if self._exponent == 1:
                 return 'Rx(π)'
-            return 'Rx({}π)'.format(self._exponent)
+            return f'Rx({self._exponent}π)'
         if self._global_shift == 0:
             if self._exponent == 1:
                 return 'X'
-            return 'X**{}'.format(self._exponent)
-        return ('XPowGate(exponent={}, '
-                'global_shift={!r})').format(self._exponent, self._global_shift)
+            return f'X**{self._exponent}'
+        return (f'XPowGate(exponent={self._exponent}, '
+                f'global_shift={self._global_shift!r})')
 
     def __repr__(self) -> str:
         if self._global_shift == -0.5:
             if protocols.is_parameterized(self._exponent):
-                return 'cirq.rx({})'.format(
-                    proper_repr(sympy.pi * self._exponent))
+                return f'cirq.rx({proper_repr(sympy.pi * self._exponent)})'
 
-            return 'cirq.rx(np.pi*{})'.format(proper_repr(self._exponent))
+            return f'cirq.rx(np.pi*{proper_repr(self._exponent)})'
         if self._global_shift == 0:
             if self._exponent == 1:
                 return 'cirq.X'
-            return '(cirq.X**{})'.format(proper_repr(self._exponent))
-        return (
-            'cirq.XPowGate(exponent={}, '
-            'global_shift={!r})'
-        ).format(proper_repr(self._exponent), self._global_shift)
+            return f'(cirq.X**{proper_repr(self._exponent)})'
+        return (f'cirq.XPowGate(exponent={proper_repr(self._exponent)}, '
+                f'global_shift={self._global_shift!r})')
 
 
 @value.value_equality
@@ -352,29 +373,26 @@ class YPowGate(eigen_gate.EigenGate,
         if self._global_shift == -0.5:
             if self._exponent == 1:
                 return 'Ry(π)'
-            return 'Ry({}π)'.format(self._exponent)
+            return f'Ry({self._exponent}π)'
         if self._global_shift == 0:
             if self._exponent == 1:
                 return 'Y'
-            return 'Y**{}'.format(self._exponent)
-        return ('YPowGate(exponent={}, '
-                'global_shift={!r})').format(self._exponent, self._global_shift)
+            return f'Y**{self._exponent}'
+        return (f'YPowGate(exponent={self._exponent}, '
+                f'global_shift={self._global_shift!r})')
 
     def __repr__(self) -> str:
         if self._global_shift == -0.5:
             if protocols.is_parameterized(self._exponent):
-                return 'cirq.ry({})'.format(
-                    proper_repr(sympy.pi * self._exponent))
+                return f'cirq.ry({proper_repr(sympy.pi * self._exponent)})'
 
-            return 'cirq.ry(np.pi*{})'.format(proper_repr(self._exponent))
+            return f'cirq.ry(np.pi*{proper_repr(self._exponent)})'
         if self._global_shift == 0:
             if self._exponent == 1:
                 return 'cirq.Y'
-            return '(cirq.Y**{})'.format(proper_repr(self._exponent))
-        return (
-            'cirq.YPowGate(exponent={}, '
-            'global_shift={!r})'
-        ).format(proper_repr(self._exponent), self._global_shift)
+            return f'(cirq.Y**{proper_repr(self._exponent)})'
+        return (f'cirq.YPowGate(exponent={proper_repr(self._exponent)}, '
+                f'global_shift={self._global_shift!r})')
 
 
 @value.value_equality
@@ -474,6 +492,14 @@ class ZPowGate(eigen_gate.EigenGate,
             (1, np.diag([0, 1])),
         ]
 
+    def _unitary_(self) -> Union[np.ndarray, NotImplementedType]:
+        if (self._global_shift == 0 and
+                not isinstance(self._exponent, sympy.Basic)):
+            static = _STATIC_Z_UNITARIES.get(self._exponent)
+            if static is not None:
+                return static.copy()
+        return super()._unitary_()
+
     def _trace_distance_bound_(self) -> Optional[float]:
         if self._is_parameterized_():
             return None
@@ -538,7 +564,7 @@ class ZPowGate(eigen_gate.EigenGate,
         if self._global_shift == -0.5:
             if self._exponent == 1:
                 return 'Rz(π)'
-            return 'Rz({}π)'.format(self._exponent)
+            return f'Rz({self._exponent}π)'
         if self._global_shift == 0:
             if self._exponent == 0.25:
                 return 'T'
@@ -550,17 +576,16 @@ class ZPowGate(eigen_gate.EigenGate,
                 return 'S**-1'
             if self._exponent == 1:
                 return 'Z'
-            return 'Z**{}'.format(self._exponent)
-        return ('ZPowGate(exponent={}, '
-                'global_shift={!r})').format(self._exponent, self._global_shift)
+            return f'Z**{self._exponent}'
+        return (f'ZPowGate(exponent={self._exponent}, '
+                f'global_shift={self._global_shift!r})')
 
     def __repr__(self) -> str:
         if self._global_shift == -0.5:
             if protocols.is_parameterized(self._exponent):
-                return 'cirq.rz({})'.format(
-                    proper_repr(sympy.pi * self._exponent))
+                return f'cirq.rz({proper_repr(sympy.pi * self._exponent)})'
 
-            return 'cirq.rz(np.pi*{!r})'.format(self._exponent)
+            return f'cirq.rz(np.pi*{self._exponent!r})'
         if self._global_shift == 0:
             if self._exponent == 0.25:
                 return 'cirq.T'
@@ -572,11 +597,9 @@ class ZPowGate(eigen_gate.EigenGate,
                 return '(cirq.S**-1)'
             if self._exponent == 1:
                 return 'cirq.Z'
-            return '(cirq.Z**{})'.format(proper_repr(self._exponent))
-        return (
-            'cirq.ZPowGate(exponent={}, '
-            'global_shift={!r})'
-        ).format(proper_repr(self._exponent), self._global_shift)
+            return f'(cirq.Z**{proper_repr(self._exponent)})'
+        return (f'cirq.ZPowGate(exponent={proper_repr(self._exponent)}, '
+                f'global_shift={self._global_shift!r})')
 
     def _commutes_on_qids_(self, qids: 'Sequence[cirq.Qid]', other: Any,
                            atol: float
@@ -750,6 +773,14 @@ class CZPowGate(eigen_gate.EigenGate,
             (1, np.diag([0, 0, 0, 1])),
         ]
 
+    def _unitary_(self) -> Union[np.ndarray, NotImplementedType]:
+        if (self._global_shift == 0 and
+                not isinstance(self._exponent, sympy.Basic)):
+            static = _STATIC_CZ_UNITARIES.get(self._exponent)
+            if static is not None:
+                return static.copy()
+        return super()._unitary_()
+
     def _trace_distance_bound_(self) -> Optional[float]:
         if self._is_parameterized_():
             return None
@@ -847,17 +878,15 @@ class CZPowGate(eigen_gate.EigenGate,
     def __str__(self) -> str:
         if self._exponent == 1:
             return 'CZ'
-        return 'CZ**{!r}'.format(self._exponent)
+        return f'CZ**{self._exponent!r}'
 
     def __repr__(self) -> str:
         if self._global_shift == 0:
             if self._exponent == 1:
                 return 'cirq.CZ'
-            return '(cirq.CZ**{})'.format(proper_repr(self._exponent))
-        return (
-            'cirq.CZPowGate(exponent={}, '
-            'global_shift={!r})'
-        ).format(proper_repr(self._exponent), self._global_shift)
+            return f'(cirq.CZ**{proper_repr(self._exponent)})'
+        return (f'cirq.CZPowGate(exponent={proper_repr(self._exponent)}, '
+                f'global_shift={self._global_shift!r})')
 
 
 class CXPowGate(eigen_gate.EigenGate, gate_features.TwoQubitGate):
@@ -228,6 +228,22 @@ def test_z_unitary():
                        np.array([[1, 0], [0, -1j]]))
 
 
+def test_common_phase_gate_unitaries_are_exact():
+    np.testing.assert_equal(cirq.unitary(cirq.Z**1.0), np.diag([1, -1]))
+    np.testing.assert_equal(cirq.unitary(cirq.S), np.diag([1, 1j]))
+    np.testing.assert_equal(cirq.unitary(cirq.S**-1), np.diag([1, -1j]))
+    np.testing.assert_allclose(cirq.unitary(cirq.T),
+                               np.diag([1, np.exp(0.25j * np.pi)]),
+                               atol=1e-8)
+    np.testing.assert_equal(cirq.unitary(cirq.CZPowGate(exponent=1.0)),
+                            np.diag([1, 1, 1, -1]))
+
+    # Callers get their own copy to modify.
+    u = cirq.unitary(cirq.S)
+    u[0, 0] = 5
+    assert cirq.unitary(cirq.S)[0, 0] == 1
+
+
 def test_y_unitary():
     assert np.allclose(cirq.unitary(cirq.Y),
                        np.array([[0, -1j], [1j, 0]]))
@@ -295,6 +295,10 @@ class EigenGate(raw_types.Gate):
 
     def __pow__(self: TSelf,
                 exponent: Union[float, sympy.Symbol]) -> 'EigenGate':
+        if exponent == 1:
+            # Gates are immutable values, so e.g. `cirq.CZ**1` can reuse the
+            # existing instance instead of allocating an identical copy.
+            return self
         new_exponent = protocols.mul(self._exponent, exponent, NotImplemented)
         if new_exponent is NotImplemented:
             return NotImplemented
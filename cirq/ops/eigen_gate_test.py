@@ -210,6 +210,10 @@ def test_pow():
         assert ZGateDef(exponent=0.5)**0.5j
     assert ZGateDef(exponent=0.5)**(1 + 0j) == ZGateDef(exponent=0.5)
 
+    g = ZGateDef(exponent=0.25)
+    assert g**1 is g
+    assert cirq.CZ**1.0 is cirq.CZ
+
 
 def test_inverse():
     assert cirq.inverse(CExpZinGate(0.25)) == CExpZinGate(-0.25)
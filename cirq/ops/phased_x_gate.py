@@ -15,6 +15,8 @@
 """An `XPowGate` conjugated by `ZPowGate`s."""
 from typing import Any, cast, Dict, Optional, Sequence, Tuple, Union
 
+import cmath
+import functools
 import math
 import numpy as np
 import sympy
@@ -42,9 +44,30 @@ class PhasedXPowGate(gate_features.SingleQubitGate):
             global_shift: How much to shift the operation's eigenvalues at
                 exponent=1.
         """
-        self._phase_exponent = value.canonicalize_half_turns(phase_exponent)
+        self._init_canonical(value.canonicalize_half_turns(phase_exponent),
+                             exponent, global_shift)
+
+    def _init_canonical(self, phase_exponent: Union[float, sympy.Symbol],
+                        exponent: Union[float, sympy.Symbol],
+                        global_shift: float) -> None:
+        self._phase_exponent = phase_exponent
         self._exponent = exponent
         self._global_shift = global_shift
+        self._value_equality_values_cached = None
+        self._is_parameterized_cached: Optional[bool] = None
+
+    @classmethod
+    def _from_canonical(cls, *, phase_exponent: Union[float, sympy.Symbol],
+                        exponent: Union[float, sympy.Symbol],
+                        global_shift: float) -> 'PhasedXPowGate':
+        """Creates a gate, trusting `phase_exponent` to be canonical already.
+
+        Skips re-canonicalizing when deriving a gate from an existing one
+        without changing its phase exponent.
+        """
+        gate = cls.__new__(cls)
+        gate._init_canonical(phase_exponent, exponent, global_shift)
+        return gate
 
     def _qasm_(self, args: 'cirq.QasmArgs',
                qubits: Tuple['cirq.Qid', ...]) -> Optional[str]:
@@ -96,14 +119,15 @@ class PhasedXPowGate(gate_features.SingleQubitGate):
         new_exponent = protocols.mul(self._exponent, exponent, NotImplemented)
         if new_exponent is NotImplemented:
             return NotImplemented
-        return PhasedXPowGate(phase_exponent=self._phase_exponent,
-                              exponent=new_exponent,
-                              global_shift=self._global_shift)
+        return PhasedXPowGate._from_canonical(
+            phase_exponent=self._phase_exponent,
+            exponent=new_exponent,
+            global_shift=self._global_shift)
 
     def _trace_distance_bound_(self) -> Optional[float]:
         if self._is_parameterized_():
             return None
-        return abs(np.sin(self._exponent * 0.5 * np.pi))
+        return abs(math.sin(self._exponent * 0.5 * math.pi))
 
     def _has_unitary_(self):
         return not self._is_parameterized_()
@@ -112,27 +136,58 @@ class PhasedXPowGate(gate_features.SingleQubitGate):
         """See `cirq.SupportsUnitary`."""
         if self._is_parameterized_():
             return None
-        z = protocols.unitary(cirq.Z**self._phase_exponent)
-        x = protocols.unitary(cirq.X**self._exponent)
-        p = np.exp(1j * np.pi * self._global_shift * self._exponent)
-        return np.dot(np.dot(z, x), np.conj(z)) * p
+        return self._shared_unitary().copy()
+
+    def _apply_unitary_(self, args: 'protocols.ApplyUnitaryArgs'
+                       ) -> Optional[np.ndarray]:
+        """See `cirq.SupportsConsistentApplyUnitary`."""
+        if self._is_parameterized_():
+            return None
+        # Reads the shared matrix directly instead of copying it.
+        u = self._shared_unitary()
+        zero = args.subspace_index(0)
+        one = args.subspace_index(1)
+        target0 = args.target_tensor[zero]
+        target1 = args.target_tensor[one]
+        args.available_buffer[zero] = u[0, 0] * target0 + u[0, 1] * target1
+        args.available_buffer[one] = u[1, 0] * target0 + u[1, 1] * target1
+        return args.available_buffer
+
+    def _shared_unitary(self) -> np.ndarray:
+        """Returns the read-only unitary of this (resolved) gate.
+
+        The result is shared between calls and must not be handed out
+        without copying it first.
+        """
+        if self._global_shift == 0:
+            static = _STATIC_UNITARIES.get(
+                (self._phase_exponent, self._exponent))
+            if static is not None:
+                return static
+        return _phased_x_unitary(self._phase_exponent, self._exponent,
+                                 self._global_shift)
 
     def _pauli_expansion_(self) -> value.LinearDict[str]:
         if self._is_parameterized_():
             return NotImplemented
-        phase_angle = np.pi * self._phase_exponent / 2
-        angle = np.pi * self._exponent / 2
+        phase_angle = math.pi * self._phase_exponent / 2
+        angle = math.pi * self._exponent / 2
         phase = 1j**(2 * self._exponent * (self._global_shift + 0.5))
+        xy = -1j * phase * math.sin(angle)
         return value.LinearDict({
-            'I': phase * np.cos(angle),
-            'X': -1j * phase * np.sin(angle) * np.cos(2 * phase_angle),
-            'Y': -1j * phase * np.sin(angle) * np.sin(2 * phase_angle),
+            'I': phase * math.cos(angle),
+            'X': xy * math.cos(2 * phase_angle),
+            'Y': xy * math.sin(2 * phase_angle),
         })
 
     def _is_parameterized_(self) -> bool:
         """See `cirq.SupportsParameterization`."""
-        return (protocols.is_parameterized(self._exponent) or
+        # Queried by most protocols, so only inspect the exponents once.
+        if self._is_parameterized_cached is None:
+            self._is_parameterized_cached = (
+                protocols.is_parameterized(self._exponent) or
                 protocols.is_parameterized(self._phase_exponent))
+        return self._is_parameterized_cached
 
     def _resolve_parameters_(self, param_resolver) -> 'PhasedXPowGate':
         """See `cirq.SupportsParameterization`."""
@@ -198,6 +253,14 @@ class PhasedXPowGate(gate_features.SingleQubitGate):
         return PhasedXPowGate
 
     def _value_equality_values_(self):
+        # Hashing and equality go through here, and for X/Y-like gates it
+        # builds a whole other gate, so compute the values only once.
+        if self._value_equality_values_cached is None:
+            self._value_equality_values_cached = (
+                self._compute_value_equality_values())
+        return self._value_equality_values_cached
+
+    def _compute_value_equality_values(self):
         if self.phase_exponent == 0:
             return common_gates.XPowGate(
                 exponent=self._exponent,
@@ -211,3 +274,46 @@ class PhasedXPowGate(gate_features.SingleQubitGate):
     def _json_dict_(self) -> Dict[str, Any]:
         return protocols.obj_to_dict_helper(
             self, ['phase_exponent', 'exponent', 'global_shift'])
+
+
+def _read_only(matrix: np.ndarray) -> np.ndarray:
+    matrix.setflags(write=False)
+    return matrix
+
+
+_X_UNITARY = _read_only(np.array([[0, 1], [1, 0]], dtype=np.complex128))
+_Y_UNITARY = _read_only(np.array([[0, -1j], [1j, 0]], dtype=np.complex128))
+
+# Exact unitaries of X and Y (self-inverse), keyed by
+# (phase_exponent, exponent) for global_shift=0.
+_STATIC_UNITARIES: Dict[Tuple[float, float], np.ndarray] = {
+    (0, 1): _X_UNITARY,
+    (0, -1): _X_UNITARY,
+    (0.5, 1): _Y_UNITARY,
+    (0.5, -1): _Y_UNITARY,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _phased_x_unitary(phase_exponent: float, exponent: float,
+                      global_shift: float) -> np.ndarray:
+    """Computes the (read-only) unitary of a resolved `PhasedXPowGate`.
+
+    This is the closed form of `Z**p · X**t · Z**-p` times the global phase:
+
+        g·[[c, -i·e^{-iπp}·s],
+           [-i·e^{iπp}·s, c]]
+
+    where c = cos(π·t/2), s = sin(π·t/2) and g = exp(i·π·t·(global_shift+½)).
+
+    Cached because simulators ask for the same few matrices over and over.
+    Callers must copy the result before handing it out.
+    """
+    half_angle = math.pi * exponent / 2
+    c = math.cos(half_angle)
+    s = math.sin(half_angle)
+    g = cmath.exp(1j * math.pi * exponent * (global_shift + 0.5))
+    w = cmath.exp(1j * math.pi * phase_exponent)
+    return _read_only(
+        np.array([[g * c, -1j * g * s / w], [-1j * g * s * w, g * c]],
+                 dtype=np.complex128))
@@ -251,3 +251,44 @@ def test_exponent_consistency(exponent, phase_exponent):
     u = cirq.protocols.unitary(g)
     u2 = cirq.protocols.unitary(g2)
     assert np.all(u == u2)
+
+
+def test_unitary_is_fresh_copy():
+    g = cirq.PhasedXPowGate(phase_exponent=0.25, exponent=0.5)
+    u = cirq.unitary(g)
+    u[0, 0] = 5
+    u2 = cirq.unitary(g)
+    assert u2[0, 0] != 5
+    assert u2.flags.writeable
+    z = cirq.unitary(cirq.Z**0.25)
+    x = cirq.unitary(cirq.X**0.5)
+    np.testing.assert_allclose(u2, z @ x @ z.conj(), atol=1e-8)
+
+
+def test_unitary_is_exact_for_x_and_y():
+    np.testing.assert_equal(
+        cirq.unitary(cirq.PhasedXPowGate(phase_exponent=0, exponent=1.0)),
+        np.array([[0, 1], [1, 0]]))
+    np.testing.assert_equal(
+        cirq.unitary(cirq.PhasedXPowGate(phase_exponent=0.5, exponent=-1)),
+        np.array([[0, -1j], [1j, 0]]))
+
+
+def test_apply_unitary_matches_unitary():
+    a, b = cirq.LineQubit.range(2)
+    g = cirq.PhasedXPowGate(phase_exponent=0.3, exponent=0.7, global_shift=0.2)
+    args = cirq.ApplyUnitaryArgs(np.array([1, 0], dtype=np.complex128),
+                                 np.empty(2, dtype=np.complex128), (0,))
+    np.testing.assert_allclose(cirq.apply_unitary(g, args),
+                               cirq.unitary(g)[:, 0],
+                               atol=1e-8)
+    result = cirq.Simulator().simulate(cirq.Circuit(g(a)))
+    np.testing.assert_allclose(result.final_state_vector,
+                               cirq.unitary(g)[:, 0],
+                               atol=1e-6)
+    np.testing.assert_allclose(cirq.unitary(cirq.Circuit(cirq.I(a), g(b))),
+                               np.kron(np.eye(2), cirq.unitary(g)),
+                               atol=1e-8)
+    np.testing.assert_allclose(cirq.unitary(cirq.Circuit(g(a), cirq.I(b))),
+                               np.kron(cirq.unitary(g), np.eye(2)),
+                               atol=1e-8)
@@ -97,6 +97,10 @@ def canonicalize_half_turns(half_turns: sympy.Basic) -> sympy.Basic:
 def canonicalize_half_turns(half_turns: type_alias.TParamVal
                            ) -> type_alias.TParamVal:
     """Wraps the input into the range (-1, +1]."""
+    if type(half_turns) is float:
+        # Fast path for the overwhelmingly common case of a plain float.
+        half_turns %= 2
+        return half_turns - 2 if half_turns > 1 else half_turns
     if isinstance(half_turns, sympy.Basic):
         if not half_turns.is_constant():
             return half_turns